@@ -0,0 +1,75 @@
+"""Measure cold import time of the API and worker entry points.
+
+Each module is imported in a fresh interpreter so the numbers reflect what a
+new uvicorn or Celery worker pays before it can serve requests.
+
+Usage:
+    python benchmarks/startup_time.py [--runs N]
+
+Run it on two checkouts to compare, e.g. before and after a change to the
+import structure.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = [
+    "src.core.image_processor",
+    "src.core.tasks",
+    "src.api.main",
+]
+
+HEAVY_MODULES = ["sklearn", "skimage", "dask"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_import(module: str) -> float:
+    """Import a module in a new interpreter and return the wall time in seconds."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=ROOT,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def loaded_heavy_modules(module: str) -> list:
+    """Return which heavy scientific libraries importing a module pulls in."""
+    check = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    return output.split(",") if output else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_import("sys") for _ in range(args.runs))
+    print(f"{'module':<28} {'median (s)':>10} {'min (s)':>8}  heavy imports")
+    print(f"{'(interpreter)':<28} {baseline:>10.3f}")
+    for module in MODULES:
+        timings = [time_import(module) for _ in range(args.runs)]
+        heavy = ", ".join(loaded_heavy_modules(module)) or "-"
+        print(
+            f"{module:<28} {statistics.median(timings):>10.3f} "
+            f"{min(timings):>8.3f}  {heavy}"
+        )
+
+
+if __name__ == "__main__":
+    main()
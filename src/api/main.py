@@ -1,25 +1,35 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy import text
 from .routes import router
-from ..db.database import engine
-from ..db.models import Base
-from src.core.image_processor import ImageProcessor
+from ..db.database import engine, init_db
 import logging
+import os
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Set INIT_DB_ON_STARTUP=false when tables are created by a separate
+# migration step (python -m src.db.database) before the workers start.
+INIT_DB_ON_STARTUP = os.getenv("INIT_DB_ON_STARTUP", "true").lower() == "true"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create database tables once the worker starts, not at import time."""
+    if INIT_DB_ON_STARTUP:
+        init_db()
+    yield
 
 app = FastAPI(
     title="High-Dimensional Image Processor",
     description="API for processing high-dimensional scientific images",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -47,6 +57,22 @@ async def root():
         "version": "1.0.0"
     }
 
+@app.get("/ready", tags=["health"])
+def readiness():
+    """Readiness probe: 200 when the database answers, 503 otherwise.
+
+    Uvicorn only serves requests after the lifespan startup has finished, so
+    reaching this endpoint already implies startup completed. It is a plain
+    def so the blocking database check runs in the threadpool.
+    """
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.error(f"Readiness check failed: {e}")
+        return JSONResponse(status_code=503, content={"ready": False, "detail": "Database unavailable"})
+    return {"ready": True}
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
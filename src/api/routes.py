@@ -1,26 +1,25 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from ..core.image_processor import ImageProcessor
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Query
+from fastapi.responses import JSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from ..core.image_processor import ImageProcessor, PROJECTION_AXES, PROJECTION_METHODS
+from ..core.cache import SingleFlightCache
+from ..core.slice_cache import SliceCache
 from ..db.models import ImageMetadata, AnalysisResult
-from typing import Optional
+from ..utils.helpers import COLORMAPS, encode_png, render_composite
+from typing import List, Optional
 import os
 import uuid
 import tempfile
 import shutil
 from fastapi import Depends
-from ..db.database import engine, SessionLocal
+from ..db.database import engine, SessionLocal, get_db
 from sqlalchemy.orm import Session
 
 router = APIRouter()
 UPLOAD_DIR = "uploads"
 processor = ImageProcessor()
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+slice_cache = SliceCache()
+render_cache = SingleFlightCache(max_bytes=256 * 1024 * 1024)
 
 @router.post("/upload")
 async def upload_image(
@@ -149,15 +148,109 @@ async def get_slice_by_id(
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
     
-    processor = ImageProcessor()
-    processor.load_image(image.file_path)
-    
     try:
-        slice_data = processor.get_slice(time, z, channel)
+        # Run in the threadpool so concurrent identical requests can share
+        # one in-flight load instead of queuing on the event loop.
+        slice_data = await run_in_threadpool(
+            slice_cache.get_slice, image.file_path, time, z, channel
+        )
         return {"slice_data": slice_data.tolist()}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+def _render_projection(file_path, axis, method, index, channels, colormaps, contrast_limits, output_format):
+    """Project, composite and encode an image, caching each stage by its parameters."""
+    projection_key = ("projection", file_path, axis, method, index, channels)
+    render_key = projection_key + (colormaps, contrast_limits, output_format)
+
+    def compute_projection():
+        # Memory-map so project() only reads the planes it reduces
+        processor = ImageProcessor()
+        processor.load_image(file_path, use_memmap=True)
+        channel_list = list(channels) if channels else None
+        if axis == 'z':
+            return processor.project(axis, method, time=index, channels=channel_list)
+        return processor.project(axis, method, z=index, channels=channel_list)
+
+    def compute_render():
+        # Reuse a cached projection when only the colormaps or limits change
+        projection = render_cache.get_or_compute(projection_key, compute_projection)
+        composite = render_composite(projection, colormaps, contrast_limits)
+        if output_format == 'png':
+            return encode_png(composite)
+        return composite.tobytes()
+
+    return render_cache.get_or_compute(render_key, compute_render)
+
+@router.get("/projection/{image_id}")
+async def get_projection_by_id(
+    image_id: str,
+    axis: str = 'z',
+    method: str = 'max',
+    time: int = 0,
+    z: int = 0,
+    channels: Optional[List[int]] = Query(None),
+    colormaps: Optional[List[str]] = Query(None),
+    contrast_min: Optional[List[float]] = Query(None),
+    contrast_max: Optional[List[float]] = Query(None),
+    format: str = 'png',
+    db: Session = Depends(get_db)
+):
+    """Render a max/min/mean/sum/std projection along Z or T as an 8-bit composite.
+
+    Each selected channel is scaled to its contrast limits and tinted with its
+    colormap. The result is returned as PNG, or as raw (height, width, 3)
+    uint8 bytes when format is 'binary'.
+    """
+    image = db.query(ImageMetadata).filter(ImageMetadata.id == image_id).first()
+    if not image:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    # Validate everything that does not need the pixel data before loading it
+    if axis not in PROJECTION_AXES:
+        raise HTTPException(status_code=400, detail=f"Axis must be one of: {', '.join(PROJECTION_AXES)}")
+    if method not in PROJECTION_METHODS:
+        raise HTTPException(status_code=400, detail=f"Method must be one of: {', '.join(PROJECTION_METHODS)}")
+    if format not in ('png', 'binary'):
+        raise HTTPException(status_code=400, detail="Format must be 'png' or 'binary'")
+    unknown = [name for name in colormaps or [] if name not in COLORMAPS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported colormaps: {', '.join(unknown)}")
+    if (contrast_min is None) != (contrast_max is None):
+        raise HTTPException(status_code=400, detail="contrast_min and contrast_max must be given together")
+    contrast_limits = None
+    if contrast_min is not None:
+        if len(contrast_min) != len(contrast_max):
+            raise HTTPException(status_code=400, detail="contrast_min and contrast_max must have the same length")
+        contrast_limits = tuple(zip(contrast_min, contrast_max))
+
+    try:
+        content = await run_in_threadpool(
+            _render_projection,
+            image.file_path,
+            axis,
+            method,
+            time if axis == 'z' else z,
+            tuple(channels) if channels else None,
+            tuple(colormaps) if colormaps else None,
+            contrast_limits,
+            format
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if format == 'png':
+        return Response(content=content, media_type="image/png")
+    shape = image.image_metadata['shape_description']
+    return Response(
+        content=content,
+        media_type="application/octet-stream",
+        headers={
+            "X-Image-Shape": f"{shape['height']},{shape['width']},3",
+            "X-Image-Dtype": "uint8"
+        }
+    )
+
 @router.post("/analyze/{image_id}")
 async def analyze_image_by_id(
     image_id: str,
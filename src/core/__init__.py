@@ -1,4 +1,6 @@
 # Empty file to make the directory a Python package
+from . import cache
 from . import image_processor
+from . import slice_cache
 from . import tasks
 from . import validators
\ No newline at end of file
@@ -0,0 +1,128 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+import numpy as np
+
+
+def _size_of(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return 0
+
+
+class SingleFlightCache:
+    """Thread-safe LRU cache that computes each key at most once at a time.
+
+    Least recently used entries are evicted once max_bytes or max_entries is
+    exceeded. Entry sizes come from size_of, which by default counts
+    ndarray.nbytes and the length of bytes values. Callers either use
+    get_or_compute, or claim a batch of keys up front and later resolve or
+    fail each one; lookups of a claimed key wait for its result.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None,
+                 size_of: Callable[[Any], int] = _size_of):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._size_of = size_of
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._size = 0
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether key is cached or currently being computed."""
+        with self._lock:
+            return key in self._entries or key in self._inflight
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key without waiting on computations."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling compute() at most once."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            # Release the key even on KeyboardInterrupt or SystemExit, or every
+            # later lookup would wait on its future forever.
+            self.fail(key, e)
+            raise
+        self.resolve(key, value)
+        return value
+
+    def claim(self, keys: Iterable[Hashable]) -> List[Hashable]:
+        """Mark keys that are neither cached nor in flight as being computed.
+
+        Returns the claimed keys; the caller must resolve or fail each one.
+        """
+        claimed = []
+        with self._lock:
+            for key in keys:
+                if key in self._entries or key in self._inflight:
+                    continue
+                self._inflight[key] = Future()
+                claimed.append(key)
+        return claimed
+
+    def resolve(self, key: Hashable, value: Any):
+        """Store the value of a claimed key and wake up anyone waiting on it."""
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        with self._lock:
+            self._store(key, value)
+            future = self._inflight.pop(key, None)
+        if future is not None:
+            future.set_result(value)
+
+    def fail(self, key: Hashable, error: Exception):
+        """Release a claimed key, raising error in anyone waiting on it."""
+        with self._lock:
+            future = self._inflight.pop(key, None)
+        if future is not None:
+            future.set_exception(error)
+
+    def clear(self):
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _store(self, key: Hashable, value: Any):
+        """Insert into the LRU, evicting until within the bounds.
+
+        Must be called with the lock held.
+        """
+        size = self._size_of(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._size -= self._size_of(self._entries.pop(key))
+        self._entries[key] = value
+        self._size += size
+        while (
+            (self.max_bytes is not None and self._size > self.max_bytes)
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= self._size_of(evicted)
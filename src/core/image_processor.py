@@ -1,25 +1,39 @@
 import numpy as np
-import dask.array as da
 import tifffile
-from sklearn.decomposition import PCA
-from skimage.filters import threshold_otsu
 from typing import Tuple, Dict, Union
 import logging
-from sklearn.cluster import KMeans
-from skimage import filters
+
+# scikit-learn and scikit-image are imported inside the methods that use them
+# so that importing this module (and starting API/Celery workers) stays fast.
 
 logger = logging.getLogger(__name__)
 
+PROJECTION_METHODS = ('max', 'min', 'mean', 'sum', 'std')
+PROJECTION_AXES = ('z', 't')
+
 class ImageProcessor:
     def __init__(self):
         self.image_data = None
         self.metadata = None
 
-    def load_image(self, file_path):
-        """Load and validate a TIFF image, ensuring 5D structure."""
+    def load_image(self, file_path, use_memmap=False):
+        """Load and validate a TIFF image, ensuring 5D structure.
+
+        With use_memmap, uncompressed images are memory-mapped so only the
+        planes that are accessed are read from disk; other images are read
+        into memory as usual.
+        """
         try:
             # Load the image
-            self.image_data = tifffile.imread(file_path)
+            self.image_data = None
+            if use_memmap:
+                try:
+                    self.image_data = tifffile.memmap(file_path, mode='r')
+                except ValueError:
+                    # Compressed or non-contiguous data cannot be mapped
+                    pass
+            if self.image_data is None:
+                self.image_data = tifffile.imread(file_path)
             
             # Ensure the image is at least 2D
             if len(self.image_data.shape) < 2:
@@ -71,6 +85,8 @@ class ImageProcessor:
             raise ValueError("No image loaded")
         
         try:
+            from sklearn.decomposition import PCA
+
             # Reshape to 2D array (samples x features)
             original_shape = self.image_data.shape
             flattened = self.image_data.reshape(-1, np.prod(original_shape[2:]))
@@ -110,16 +126,93 @@ class ImageProcessor:
             logger.error(f"Error calculating statistics: {str(e)}")
             raise ValueError(f"Failed to calculate statistics: {str(e)}")
 
+    def project(self, axis='z', method='max', time=0, z=0, channels=None, chunk_size=16):
+        """Project the stack along Z (at a time point) or T (at a z slice).
+
+        Returns an array of shape (channels, height, width). Planes are reduced
+        chunk_size at a time so temporaries stay bounded for long stacks; max
+        and min keep the input dtype, the other methods return float64.
+        """
+        if self.image_data is None:
+            raise ValueError("No image loaded")
+
+        try:
+            if axis not in PROJECTION_AXES:
+                raise ValueError(f"Unsupported projection axis: {axis}")
+            if method not in PROJECTION_METHODS:
+                raise ValueError(f"Unsupported projection method: {method}")
+
+            n_channels = self.image_data.shape[2]
+            if channels is None:
+                channels = list(range(n_channels))
+            if not channels or any(c < 0 or c >= n_channels for c in channels):
+                raise ValueError("Channel indices out of range")
+
+            if axis == 'z':
+                if not 0 <= time < self.image_data.shape[0]:
+                    raise ValueError("Time index out of range")
+                stack = self.image_data[time]
+            else:
+                if not 0 <= z < self.image_data.shape[1]:
+                    raise ValueError("Z index out of range")
+                stack = self.image_data[:, z]
+
+            # stack is (planes, channels, height, width)
+            n_planes = stack.shape[0]
+            result = None
+            m2 = None
+            n_seen = 0
+            for start in range(0, n_planes, max(1, chunk_size)):
+                chunk = stack[start:start + chunk_size, channels]
+                if method == 'max':
+                    reduced = chunk.max(axis=0)
+                    result = reduced if result is None else np.maximum(result, reduced)
+                elif method == 'min':
+                    reduced = chunk.min(axis=0)
+                    result = reduced if result is None else np.minimum(result, reduced)
+                elif method == 'std':
+                    # Merge per-chunk mean and sum of squared deviations (M2)
+                    # with Chan et al.'s pairwise update, which avoids the
+                    # cancellation of E[x^2] - E[x]^2 on bright or long stacks.
+                    chunk = chunk.astype(np.float64)
+                    count = chunk.shape[0]
+                    chunk_mean = chunk.mean(axis=0)
+                    chunk_m2 = np.square(chunk - chunk_mean).sum(axis=0)
+                    if result is None:
+                        result, m2 = chunk_mean, chunk_m2
+                    else:
+                        total = n_seen + count
+                        delta = chunk_mean - result
+                        result = result + delta * (count / total)
+                        m2 = m2 + chunk_m2 + np.square(delta) * (n_seen * count / total)
+                    n_seen += count
+                else:
+                    reduced = chunk.astype(np.float64).sum(axis=0)
+                    result = reduced if result is None else result + reduced
+
+            if method == 'mean':
+                result /= n_planes
+            elif method == 'std':
+                result = np.sqrt(m2 / n_planes)
+            return result
+        except Exception as e:
+            logger.error(f"Error computing projection: {str(e)}")
+            raise ValueError(f"Failed to compute projection: {str(e)}")
+
     def segment_channel(self, time=0, z=0, channel=0, method='otsu'):
         """Segment a specific channel using either Otsu or K-means."""
         try:
             slice_data = self.get_slice(time, z, channel)
             
             if method.lower() == 'otsu':
+                from skimage import filters
+
                 threshold = filters.threshold_otsu(slice_data)
                 return slice_data > threshold
             
             elif method.lower() == 'kmeans':
+                from sklearn.cluster import KMeans
+
                 kmeans = KMeans(n_clusters=2, random_state=42)
                 flattened = slice_data.reshape(-1, 1)
                 labels = kmeans.fit_predict(flattened)
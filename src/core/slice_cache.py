@@ -0,0 +1,148 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from .cache import SingleFlightCache
+from .image_processor import ImageProcessor
+
+logger = logging.getLogger(__name__)
+
+SliceKey = Tuple[str, int, int, int]
+StreamKey = Tuple[str, int]
+
+
+def _reader_size(reader: ImageProcessor) -> int:
+    # A memory map only holds the pages that are being read; a compressed
+    # file that had to be decoded keeps the whole array alive.
+    if isinstance(reader.image_data, np.memmap):
+        return 0
+    return reader.image_data.nbytes
+
+
+class SliceCache:
+    """Serve 2D slices from memory with request coalescing and read-ahead.
+
+    Identical slice requests that arrive while a load is in flight share a
+    single load. Each (file, channel) stream remembers its last position and
+    the unit step it is moving in along time or z, and the planes ahead of it
+    are loaded into a bounded LRU buffer by a background thread.
+
+    Files are opened once and kept for the most recently used max_open_files
+    paths. Uncompressed TIFFs are memory-mapped, so each plane read only
+    touches that plane's bytes. Compressed TIFFs have to be decoded whole;
+    those arrays count against max_reader_bytes, and a file larger than that
+    is not kept open, so it is decoded once per read-ahead batch instead.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, prefetch_depth=8, max_workers=1,
+                 max_open_files=4, max_streams=1024, max_reader_bytes=256 * 1024 * 1024):
+        self.prefetch_depth = prefetch_depth
+        self.max_streams = max_streams
+        self._slices = SingleFlightCache(max_bytes=max_bytes)
+        self._readers = SingleFlightCache(
+            max_bytes=max_reader_bytes, max_entries=max_open_files, size_of=_reader_size
+        )
+        self._lock = threading.Lock()
+        self._streams: "OrderedDict[StreamKey, Tuple[Tuple[int, int], Tuple[int, int]]]" = OrderedDict()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="slice-prefetch"
+        )
+
+    def get_slice(self, file_path, time=0, z=0, channel=0):
+        """Return a read-only 2D slice, loading it at most once."""
+        key = (file_path, time, z, channel)
+        data = self._slices.get_or_compute(key, lambda: self._read_plane(key))
+        self._advance(key)
+        return data
+
+    def clear(self):
+        """Drop all buffered slices, open files and access history."""
+        self._slices.clear()
+        self._readers.clear()
+        with self._lock:
+            self._streams.clear()
+
+    def _open(self, file_path) -> ImageProcessor:
+        reader = ImageProcessor()
+        reader.load_image(file_path, use_memmap=True)
+        return reader
+
+    def _reader(self, file_path) -> ImageProcessor:
+        return self._readers.get_or_compute(file_path, lambda: self._open(file_path))
+
+    def _read_plane(self, key: SliceKey, reader: Optional[ImageProcessor] = None) -> np.ndarray:
+        file_path, time, z, channel = key
+        if reader is None:
+            reader = self._reader(file_path)
+        return np.asarray(reader.get_slice(time, z, channel))
+
+    def _ahead_keys(self, key: SliceKey, step: Tuple[int, int]) -> List[SliceKey]:
+        """List the keys of the next planes along step that exist in the image."""
+        file_path, time, z, channel = key
+        reader = self._readers.get(file_path)
+        if reader is None:
+            return []
+        shape = reader.image_data.shape
+        keys = []
+        for i in range(1, self.prefetch_depth + 1):
+            t, zz = time + step[0] * i, z + step[1] * i
+            if not (0 <= t < shape[0] and 0 <= zz < shape[1]):
+                break
+            keys.append((file_path, t, zz, channel))
+        return keys
+
+    def _advance(self, key: SliceKey):
+        """Update the stream's direction and top up its read-ahead window."""
+        file_path, time, z, channel = key
+        stream_key = (file_path, channel)
+        with self._lock:
+            stream = self._streams.pop(stream_key, None)
+            # Default to scrolling forward in z until a direction is seen
+            step = stream[1] if stream else (0, 1)
+            if stream is not None:
+                delta = (time - stream[0][0], z - stream[0][1])
+                # Only unit moves along a single axis count as scrolling; a jump
+                # keeps the previous direction.
+                if delta in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+                    step = delta
+            self._streams[stream_key] = ((time, z), step)
+            while len(self._streams) > self.max_streams:
+                self._streams.popitem(last=False)
+
+        ahead = self._ahead_keys(key, step)
+        missing = [k for k in ahead if k not in self._slices]
+        # Refill in batches rather than submitting a task for every plane
+        threshold = min(len(ahead), max(1, self.prefetch_depth // 2))
+        if not missing or len(missing) < threshold:
+            return
+        claimed = self._slices.claim(missing)
+        if claimed:
+            self._executor.submit(self._prefetch, file_path, claimed)
+
+    def _prefetch(self, file_path, keys: List[SliceKey]):
+        # Every claimed key must be resolved or failed, or requests for it
+        # would wait forever.
+        pending = list(reversed(keys))
+        try:
+            # Hold the reader for the whole batch so a file too large to stay
+            # open is still decoded only once here.
+            reader = self._reader(file_path)
+            while pending:
+                key = pending[-1]
+                try:
+                    data = self._read_plane(key, reader)
+                except Exception as e:
+                    logger.error(f"Error prefetching slice: {str(e)}")
+                    self._slices.fail(key, e)
+                else:
+                    self._slices.resolve(key, data)
+                pending.pop()
+        except BaseException as e:
+            logger.error(f"Error prefetching slices: {str(e)}")
+            for key in pending:
+                self._slices.fail(key, e)
+            raise
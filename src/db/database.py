@@ -17,4 +17,15 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def init_db():
+    """Create any missing tables for the registered models."""
+    # Import the models so they are registered on Base.metadata
+    from . import models  # noqa: F401
+    Base.metadata.create_all(bind=engine)
+
+if __name__ == "__main__":
+    # Allows running schema creation as a separate migration step:
+    #   python -m src.db.database
+    init_db()
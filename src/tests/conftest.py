@@ -6,9 +6,9 @@ import os
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from ..src.db.database import Base
-from ..src.api.main import app
-from ..src.db.database import get_db
+from src.db.database import Base
+from src.api.main import app
+from src.db.database import get_db
 from src.core.image_processor import ImageProcessor
 
 @pytest.fixture
@@ -0,0 +1,81 @@
+import threading
+import pytest
+import numpy as np
+from src.core.cache import SingleFlightCache
+
+def test_get_or_compute_computes_once():
+    """Test cached results are reused per key."""
+    cache = SingleFlightCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return np.zeros((2, 2))
+
+    first = cache.get_or_compute(("key",), compute)
+    second = cache.get_or_compute(("key",), compute)
+
+    assert first is second
+    assert len(calls) == 1
+    assert not first.flags.writeable
+
+def test_concurrent_lookups_wait_for_claimed_key():
+    """Test lookups of a claimed key wait for its result instead of computing."""
+    cache = SingleFlightCache()
+    assert cache.claim(["a", "b"]) == ["a", "b"]
+    assert cache.claim(["a"]) == []
+
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(cache.get_or_compute("a", lambda: "computed"))
+    )
+    thread.start()
+    cache.resolve("a", "resolved")
+    thread.join()
+
+    assert results == ["resolved"]
+
+def test_failed_key_raises_and_is_released():
+    """Test failures propagate to waiters and are not cached."""
+    cache = SingleFlightCache()
+    cache.claim(["a"])
+    cache.fail("a", ValueError("boom"))
+
+    assert "a" not in cache
+    with pytest.raises(ValueError):
+        cache.get_or_compute("b", lambda: int("x"))
+    assert "b" not in cache
+
+def test_base_exception_releases_key():
+    """Test a compute interrupted by a BaseException does not leave the key in flight."""
+    cache = SingleFlightCache()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        cache.get_or_compute("a", interrupted)
+
+    assert "a" not in cache
+    assert cache.get_or_compute("a", lambda: 1) == 1
+
+def test_evicts_to_byte_bound():
+    """Test the cache stays within its byte budget."""
+    cache = SingleFlightCache(max_bytes=100)
+    cache.get_or_compute("a", lambda: b"x" * 60)
+    cache.get_or_compute("b", lambda: b"y" * 60)
+
+    assert "a" not in cache
+    assert "b" in cache
+
+def test_evicts_to_entry_bound():
+    """Test least recently used entries are dropped beyond max_entries."""
+    cache = SingleFlightCache(max_entries=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get("a")
+    cache.get_or_compute("c", lambda: 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
@@ -52,4 +52,58 @@ def test_invalid_slice_indices(loaded_processor):
 def test_invalid_segmentation_method(loaded_processor):
     """Test error handling for invalid segmentation method."""
     with pytest.raises(ValueError):
-        loaded_processor.segment_channel(method='invalid')
\ No newline at end of file
+        loaded_processor.segment_channel(method='invalid')
+
+def test_import_does_not_load_heavy_libraries():
+    """Test importing the processor defers sklearn, skimage and dask."""
+    import os
+    import subprocess
+    import sys
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    check = (
+        "import sys, src.core.image_processor; "
+        "print([m for m in ('sklearn', 'skimage', 'dask') if m in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.strip()
+    assert output == "[]"
+
+@pytest.mark.parametrize("method", ['max', 'min', 'mean', 'sum', 'std'])
+def test_project_z_matches_numpy(loaded_processor, method):
+    """Test chunked Z projections match a direct NumPy reduction."""
+    projection = loaded_processor.project(axis='z', method=method, time=1, chunk_size=2)
+    expected = getattr(np, method)(loaded_processor.image_data[1].astype(np.float64), axis=0)
+
+    assert projection.shape == (4, 100, 100)
+    np.testing.assert_allclose(projection, expected, atol=1e-5)
+
+def test_project_std_bright_long_stack(processor):
+    """Test chunked std stays accurate for bright stacks with small variance."""
+    rng = np.random.default_rng(0)
+    processor.image_data = 1e8 + rng.standard_normal((1, 50, 1, 8, 8))
+    projection = processor.project(axis='z', method='std', chunk_size=7)
+
+    np.testing.assert_allclose(projection, processor.image_data[0].std(axis=0), rtol=1e-6)
+
+def test_project_t_selected_channels(loaded_processor):
+    """Test T projections for a subset of channels."""
+    projection = loaded_processor.project(axis='t', method='max', z=2, channels=[3, 1])
+    expected = loaded_processor.image_data[:, 2][:, [3, 1]].max(axis=0)
+
+    np.testing.assert_array_equal(projection, expected)
+    assert projection.dtype == np.uint8
+
+def test_invalid_projection(loaded_processor):
+    """Test error handling for invalid projection parameters."""
+    with pytest.raises(ValueError):
+        loaded_processor.project(method='median')
+    with pytest.raises(ValueError):
+        loaded_processor.project(axis='x')
+    with pytest.raises(ValueError):
+        loaded_processor.project(channels=[99])
@@ -0,0 +1,34 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from src.api import main
+from src.api.main import app
+
+def test_ready_when_database_reachable(test_client, test_db, monkeypatch):
+    """Test the readiness probe returns 200 when the database answers."""
+    monkeypatch.setattr(main, "engine", test_db)
+    response = test_client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json() == {"ready": True}
+
+def test_not_ready_when_database_unreachable(test_client, tmp_path, monkeypatch):
+    """Test the readiness probe returns 503 when the database cannot be reached."""
+    unreachable = create_engine(f"sqlite:///{tmp_path}/missing/dir/test.db")
+    monkeypatch.setattr(main, "engine", unreachable)
+    response = test_client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_startup_init_db_flag(enabled, monkeypatch):
+    """Test INIT_DB_ON_STARTUP controls whether startup creates the tables."""
+    calls = []
+    monkeypatch.setattr(main, "INIT_DB_ON_STARTUP", enabled)
+    monkeypatch.setattr(main, "init_db", lambda: calls.append(1))
+
+    with TestClient(app):
+        pass
+
+    assert len(calls) == (1 if enabled else 0)
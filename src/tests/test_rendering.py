@@ -0,0 +1,53 @@
+import struct
+import zlib
+import pytest
+import numpy as np
+from src.utils.helpers import encode_png, render_composite
+
+def test_render_composite_colormaps_and_limits():
+    """Test channels are scaled to their limits and tinted additively."""
+    channels = np.array([
+        np.full((2, 2), 50.0),
+        np.full((2, 2), 200.0),
+    ])
+    rgb = render_composite(channels, ['red', 'green'], [(0, 100), (100, 200)])
+
+    assert rgb.shape == (2, 2, 3)
+    assert rgb.dtype == np.uint8
+    np.testing.assert_array_equal(rgb[0, 0], [128, 255, 0])
+
+def test_render_composite_default_gray():
+    """Test a single channel defaults to gray and its own min/max."""
+    channels = np.arange(4, dtype=np.uint16).reshape(1, 2, 2)
+    rgb = render_composite(channels)
+
+    assert rgb[0, 0].tolist() == [0, 0, 0]
+    assert rgb[1, 1].tolist() == [255, 255, 255]
+
+def test_render_composite_default_many_channels():
+    """Test default colormaps cycle for more channels than named defaults."""
+    channels = np.zeros((8, 2, 2))
+    channels[6] = 1.0
+    rgb = render_composite(channels, contrast_limits=[(0, 1)] * 8)
+
+    # Channel 6 wraps around to the first default colormap (red)
+    assert rgb[0, 0].tolist() == [255, 0, 0]
+
+def test_render_composite_invalid_colormap():
+    """Test error handling for unknown colormaps."""
+    with pytest.raises(ValueError):
+        render_composite(np.zeros((1, 2, 2)), ['plasma'])
+
+def test_encode_png_roundtrip():
+    """Test the PNG header and pixel data decode back to the input."""
+    image = np.random.randint(0, 255, (5, 7, 3), dtype=np.uint8)
+    png = encode_png(image)
+
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    width, height = struct.unpack(">II", png[16:24])
+    assert (width, height) == (7, 5)
+
+    idat_length = struct.unpack(">I", png[33:37])[0]
+    raw = zlib.decompress(png[41:41 + idat_length])
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(5, 1 + 7 * 3)
+    np.testing.assert_array_equal(rows[:, 1:].reshape(image.shape), image)
@@ -0,0 +1,120 @@
+import uuid
+import pytest
+import numpy as np
+from sqlalchemy.orm import sessionmaker
+from src.api import routes
+from src.core.image_processor import ImageProcessor
+from src.db.models import ImageMetadata
+from src.utils.helpers import render_composite
+
+@pytest.fixture(autouse=True)
+def clear_render_cache():
+    routes.render_cache.clear()
+    yield
+    routes.render_cache.clear()
+
+@pytest.fixture
+def stored_image(test_db, test_image):
+    """Register the test image in the test database."""
+    processor = ImageProcessor()
+    metadata = processor.load_image(test_image)
+    image_id = str(uuid.uuid4())
+    session = sessionmaker(bind=test_db)()
+    session.add(ImageMetadata(
+        id=image_id,
+        filename="test_image.tiff",
+        file_path=test_image,
+        image_metadata=metadata
+    ))
+    session.commit()
+    session.close()
+    return image_id, processor.image_data
+
+@pytest.fixture
+def call_counts(monkeypatch):
+    """Count image loads, projections and composite renders."""
+    counts = {'load': 0, 'project': 0, 'render': 0}
+
+    def counting(name, original):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return original(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(ImageProcessor, "load_image", counting('load', ImageProcessor.load_image))
+    monkeypatch.setattr(ImageProcessor, "project", counting('project', ImageProcessor.project))
+    monkeypatch.setattr(routes, "render_composite", counting('render', routes.render_composite))
+    return counts
+
+def test_projection_png(test_client, stored_image):
+    """Test the default projection is returned as a PNG."""
+    image_id, _ = stored_image
+    response = test_client.get(f"/api/v1/projection/{image_id}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content.startswith(b"\x89PNG\r\n\x1a\n")
+
+def test_projection_binary(test_client, stored_image):
+    """Test binary projections return raw RGB bytes with their shape."""
+    image_id, data = stored_image
+    response = test_client.get(
+        f"/api/v1/projection/{image_id}",
+        params={'axis': 't', 'z': 1, 'channels': [2, 0], 'colormaps': ['green', 'magenta'], 'format': 'binary'}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["x-image-shape"] == "100,100,3"
+    assert response.headers["x-image-dtype"] == "uint8"
+    expected = render_composite(data[:, 1][:, [2, 0]].max(axis=0), ['green', 'magenta'])
+    assert response.content == expected.tobytes()
+
+def test_projection_cache_per_parameter_set(test_client, stored_image, call_counts):
+    """Test projections are reused when only rendering parameters change."""
+    image_id, _ = stored_image
+    url = f"/api/v1/projection/{image_id}"
+    params = {'method': 'mean', 'channels': [0, 1], 'colormaps': ['red', 'green']}
+
+    test_client.get(url, params=params)
+    test_client.get(url, params=params)
+    assert (call_counts['project'], call_counts['render']) == (1, 1)
+
+    test_client.get(url, params={**params, 'colormaps': ['cyan', 'yellow']})
+    test_client.get(url, params={**params, 'contrast_min': [0, 0], 'contrast_max': [100, 100]})
+    test_client.get(url, params={**params, 'format': 'binary'})
+    assert (call_counts['project'], call_counts['render']) == (1, 4)
+
+    test_client.get(url, params={**params, 'method': 'std'})
+    test_client.get(url, params={**params, 'time': 1})
+    test_client.get(url, params={**params, 'channels': [1]})
+    assert (call_counts['project'], call_counts['render']) == (4, 7)
+    assert call_counts['load'] == 4
+
+@pytest.mark.parametrize("params", [
+    {'axis': 'x'},
+    {'method': 'median'},
+    {'format': 'jpeg'},
+    {'colormaps': ['plasma']},
+    {'contrast_min': [0]},
+    {'contrast_min': [0, 0], 'contrast_max': [1]},
+])
+def test_projection_invalid_parameters(test_client, stored_image, call_counts, params):
+    """Test invalid parameters are rejected before the image is loaded."""
+    image_id, _ = stored_image
+    response = test_client.get(f"/api/v1/projection/{image_id}", params=params)
+
+    assert response.status_code == 400
+    assert call_counts['load'] == 0
+
+def test_projection_channel_out_of_range(test_client, stored_image):
+    """Test channel indices are checked against the image."""
+    image_id, _ = stored_image
+    response = test_client.get(f"/api/v1/projection/{image_id}", params={'channels': [9]})
+
+    assert response.status_code == 400
+
+def test_projection_unknown_image(test_client):
+    """Test projections of unknown images return 404."""
+    response = test_client.get("/api/v1/projection/missing")
+
+    assert response.status_code == 404
@@ -0,0 +1,145 @@
+import os
+import threading
+import time as time_module
+import pytest
+import numpy as np
+import tifffile
+from src.core.image_processor import ImageProcessor
+from src.core.slice_cache import SliceCache
+
+@pytest.fixture
+def load_counter(monkeypatch):
+    """Count ImageProcessor.load_image calls, slowing each one down."""
+    calls = []
+    original = ImageProcessor.load_image
+
+    def counting_load(self, file_path, **kwargs):
+        calls.append(file_path)
+        time_module.sleep(0.05)
+        return original(self, file_path, **kwargs)
+
+    monkeypatch.setattr(ImageProcessor, "load_image", counting_load)
+    return calls
+
+@pytest.fixture
+def deep_stack(tmp_path):
+    """Create a TIFF with a deep z stack (T=1, Z=40, C=2, Y=16, X=16)."""
+    image = np.random.randint(0, 255, (1, 40, 2, 16, 16), dtype=np.uint8)
+    file_path = os.path.join(tmp_path, "deep_stack.tiff")
+    tifffile.imwrite(file_path, image, photometric='minisblack')
+    return file_path, image
+
+@pytest.fixture
+def plane_reads(monkeypatch):
+    """Record each plane read from file with the thread it ran on."""
+    reads = []
+    original = SliceCache._read_plane
+
+    def recording_read(self, key, reader=None):
+        reads.append((key, threading.current_thread().name))
+        return original(self, key, reader)
+
+    monkeypatch.setattr(SliceCache, "_read_plane", recording_read)
+    return reads
+
+def request_thread_reads(plane_reads):
+    return [key for key, thread in plane_reads if not thread.startswith("slice-prefetch")]
+
+def drain_prefetch(cache):
+    """Wait for queued read-ahead; the single prefetch worker runs tasks in order."""
+    cache._executor.submit(lambda: None).result()
+
+def test_get_slice_matches_processor(loaded_processor, test_image):
+    """Test cached slices match the processor output."""
+    cache = SliceCache()
+    slice_data = cache.get_slice(test_image, time=1, z=2, channel=3)
+
+    np.testing.assert_array_equal(slice_data, loaded_processor.get_slice(1, 2, 3))
+    assert not slice_data.flags.writeable
+
+def test_concurrent_requests_coalesce(test_image, load_counter):
+    """Test identical in-flight requests share a single load."""
+    cache = SliceCache(prefetch_depth=0)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_slice(test_image, 0, 1, 0)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert len(load_counter) == 1
+
+def test_first_request_prefetches_window(deep_stack, plane_reads):
+    """Test the first request reads one plane and read-ahead fills the rest."""
+    file_path, image = deep_stack
+    cache = SliceCache(prefetch_depth=4)
+    cache.get_slice(file_path, time=0, z=0, channel=1)
+    drain_prefetch(cache)
+
+    ahead = [(file_path, 0, z, 1) for z in range(1, 5)]
+    assert all(cache._slices.get(key) is not None for key in ahead)
+    assert request_thread_reads(plane_reads) == [(file_path, 0, 0, 1)]
+
+    for z in range(1, 5):
+        np.testing.assert_array_equal(cache.get_slice(file_path, 0, z, 1), image[0, z, 1])
+    assert request_thread_reads(plane_reads) == [(file_path, 0, 0, 1)]
+
+def test_long_z_scroll_served_from_memory(deep_stack, load_counter, plane_reads):
+    """Test scrolling well past the first window only reads the first plane on request."""
+    file_path, image = deep_stack
+    cache = SliceCache(prefetch_depth=4)
+    for z in range(image.shape[1]):
+        slice_data = cache.get_slice(file_path, time=0, z=z, channel=1)
+        np.testing.assert_array_equal(slice_data, image[0, z, 1])
+        drain_prefetch(cache)
+
+    assert request_thread_reads(plane_reads) == [(file_path, 0, 0, 1)]
+    assert sorted(key for key, _ in plane_reads) == [
+        (file_path, 0, z, 1) for z in range(image.shape[1])
+    ]
+    assert len(load_counter) == 1
+    assert isinstance(cache._readers.get(file_path).image_data, np.memmap)
+
+def test_decoded_readers_count_against_byte_bound(tmp_path):
+    """Test compressed files are only kept open within max_reader_bytes."""
+    image = np.random.randint(0, 255, (1, 4, 1, 32, 32), dtype=np.uint8)
+    file_path = os.path.join(tmp_path, "compressed.tiff")
+    tifffile.imwrite(file_path, image, photometric='minisblack', compression='zlib')
+
+    cache = SliceCache(prefetch_depth=0, max_reader_bytes=image.nbytes - 1)
+    np.testing.assert_array_equal(cache.get_slice(file_path, z=1), image[0, 1, 0])
+    assert file_path not in cache._readers
+
+    cache = SliceCache(prefetch_depth=0, max_reader_bytes=image.nbytes)
+    cache.get_slice(file_path, z=1)
+    assert file_path in cache._readers
+
+def test_streams_are_bounded(deep_stack):
+    """Test access history is evicted beyond max_streams."""
+    file_path, _ = deep_stack
+    cache = SliceCache(prefetch_depth=0, max_streams=1)
+    cache.get_slice(file_path, channel=0)
+    cache.get_slice(file_path, channel=1)
+
+    assert list(cache._streams) == [(file_path, 1)]
+
+def test_time_scroll_changes_direction(test_image, load_counter):
+    """Test a scroll along time switches the read-ahead direction."""
+    cache = SliceCache(prefetch_depth=4)
+    cache.get_slice(test_image, time=0, z=0, channel=0)
+    cache.get_slice(test_image, time=1, z=0, channel=0)
+    cache._executor.shutdown(wait=True)
+
+    assert cache._streams[(test_image, 0)][1] == (1, 0)
+    assert len(load_counter) == 1
+
+def test_invalid_slice_not_cached(test_image):
+    """Test out-of-range slices raise and are not buffered."""
+    cache = SliceCache()
+    with pytest.raises(ValueError):
+        cache.get_slice(test_image, time=999, z=0, channel=0)
+    assert (test_image, 999, 0, 0) not in cache._slices
@@ -1,8 +1,21 @@
 import os
-from typing import Optional
+import struct
+import zlib
+from typing import Optional, Sequence, Tuple
 import numpy as np
 from pathlib import Path
 
+COLORMAPS = {
+    'gray': (1.0, 1.0, 1.0),
+    'red': (1.0, 0.0, 0.0),
+    'green': (0.0, 1.0, 0.0),
+    'blue': (0.0, 0.0, 1.0),
+    'cyan': (0.0, 1.0, 1.0),
+    'magenta': (1.0, 0.0, 1.0),
+    'yellow': (1.0, 1.0, 0.0),
+}
+DEFAULT_COLORMAPS = ['red', 'green', 'blue', 'cyan', 'magenta', 'yellow']
+
 def ensure_directory(directory: str) -> None:
     """Ensure a directory exists, create if it doesn't."""
     Path(directory).mkdir(parents=True, exist_ok=True)
@@ -64,4 +77,68 @@ def validate_image_metadata(metadata: dict) -> bool:
     shape_keys = {
         'time_frames', 'z_slices', 'channels', 'height', 'width'
     }
-    return all(key in metadata['shape_description'] for key in shape_keys)
\ No newline at end of file
+    return all(key in metadata['shape_description'] for key in shape_keys)
+
+def render_composite(
+    channels: np.ndarray,
+    colormaps: Optional[Sequence[str]] = None,
+    contrast_limits: Optional[Sequence[Tuple[float, float]]] = None
+) -> np.ndarray:
+    """Blend (channels, height, width) planes into an 8-bit (height, width, 3) RGB image.
+
+    Each channel is scaled to its contrast limits (its own min/max by default),
+    tinted with its colormap and the results are summed and clipped.
+    """
+    n_channels = channels.shape[0]
+    if colormaps is None:
+        if n_channels == 1:
+            colormaps = ['gray']
+        else:
+            colormaps = [DEFAULT_COLORMAPS[i % len(DEFAULT_COLORMAPS)] for i in range(n_channels)]
+    if len(colormaps) != n_channels:
+        raise ValueError(f"Expected {n_channels} colormaps, got {len(colormaps)}")
+    unknown = [name for name in colormaps if name not in COLORMAPS]
+    if unknown:
+        raise ValueError(f"Unsupported colormaps: {', '.join(unknown)}")
+
+    if contrast_limits is None:
+        low = channels.min(axis=(1, 2)).astype(np.float32)
+        high = channels.max(axis=(1, 2)).astype(np.float32)
+    else:
+        if len(contrast_limits) != n_channels:
+            raise ValueError(f"Expected {n_channels} contrast limits, got {len(contrast_limits)}")
+        low, high = np.asarray(contrast_limits, dtype=np.float32).T
+
+    span = high - low
+    span[span == 0] = np.inf
+    scaled = (channels.astype(np.float32) - low[:, None, None]) / span[:, None, None]
+    np.clip(scaled, 0, 1, out=scaled)
+
+    colors = np.array([COLORMAPS[name] for name in colormaps], dtype=np.float32)
+    rgb = np.tensordot(scaled, colors, axes=([0], [0]))
+    return (np.clip(rgb, 0, 1) * 255 + 0.5).astype(np.uint8)
+
+def encode_png(image: np.ndarray) -> bytes:
+    """Encode an 8-bit grayscale (H, W) or RGB (H, W, 3) array as PNG."""
+    if image.dtype != np.uint8 or image.ndim not in (2, 3):
+        raise ValueError("PNG encoding requires an 8-bit grayscale or RGB image")
+    if image.ndim == 3 and image.shape[2] != 3:
+        raise ValueError("PNG encoding requires an 8-bit grayscale or RGB image")
+    height, width = image.shape[:2]
+    color_type = 0 if image.ndim == 2 else 2
+
+    rows = np.ascontiguousarray(image).reshape(height, -1)
+    # Every scanline starts with filter type 0 (none)
+    raw = np.hstack([np.zeros((height, 1), dtype=np.uint8), rows]).tobytes()
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(tag + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", crc)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 6))
+        + chunk(b"IEND", b"")
+    )